@@ -18,6 +18,27 @@ const chromePath =
     ? '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
     : 'google-chrome');
 const screenshotDir = process.env.VIEWPORT_SCREENSHOT_DIR || '/tmp/web-katrain-viewport-check';
+// Attach to an already running Chrome (started with --remote-debugging-port)
+// instead of cold-launching one for every run. Viewports run side by side in
+// separate browser contexts, so that Chrome should be started with
+// background throttling disabled.
+const reusedDevtoolsPort = process.env.CHROME_DEVTOOLS_PORT ? Number(process.env.CHROME_DEVTOOLS_PORT) : null;
+// Optional Chrome profile directory kept between runs so the launched
+// browser skips first-run profile setup. Viewports still run in throwaway
+// contexts, so app storage and page caches never carry over.
+const chromeProfileDir = process.env.VIEWPORT_CHROME_PROFILE || null;
+// More pages per browser than this mostly queue up behind each other's
+// screenshots and main-thread work.
+const viewportConcurrency = Math.max(1, Number(process.env.VIEWPORT_CONCURRENCY) || 2);
+// The rendered Go board; every wait and probe keys off this element.
+const BOARD_SELECTOR = '[data-board-snapshot="true"]';
+// Install-prompt assets and remote model downloads never affect the layout
+// checks, but they compete with the app bundle for the first load.
+const BLOCKED_URLS = [
+  '*/manifest.webmanifest',
+  '*/pwa/*',
+  '*://media.katagotraining.org/*',
+];
 
 const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
 
@@ -29,6 +50,25 @@ async function freePort() {
   return address.port;
 }
 
+// Cheap readiness probe: a TCP connect fails fast until the process is
+// listening, so it can poll far more often than a full HTTP request.
+async function waitForPort(port, timeoutMs = 10_000) {
+  const deadline = Date.now() + timeoutMs;
+  while (Date.now() < deadline) {
+    const open = await new Promise((resolve) => {
+      const socket = net.connect({ host: '127.0.0.1', port });
+      socket.once('connect', () => {
+        socket.destroy();
+        resolve(true);
+      });
+      socket.once('error', () => resolve(false));
+    });
+    if (open) return;
+    await sleep(50);
+  }
+  throw new Error(`Timed out waiting for port ${port}`);
+}
+
 async function waitForHttp(url, timeoutMs = 10_000) {
   const started = Date.now();
   while (Date.now() - started < timeoutMs) {
@@ -38,7 +78,7 @@ async function waitForHttp(url, timeoutMs = 10_000) {
     } catch {
       // Keep polling.
     }
-    await sleep(200);
+    await sleep(50);
   }
   throw new Error(`Timed out waiting for ${url}`);
 }
@@ -156,8 +196,8 @@ function connectDevtools(webSocketDebuggerUrl) {
 
   return {
     ready: readyPromise,
-    send(method, params = {}) {
-      const message = { id: ++nextId, method, params };
+    send(method, params = {}, sessionId) {
+      const message = sessionId ? { id: ++nextId, method, params, sessionId } : { id: ++nextId, method, params };
       return new Promise((resolve) => {
         pending.set(message.id, resolve);
         writeFrame(JSON.stringify(message));
@@ -169,33 +209,171 @@ function connectDevtools(webSocketDebuggerUrl) {
   };
 }
 
-async function chromeTarget(port) {
-  for (let i = 0; i < 40; i++) {
+async function chromeBrowserEndpoint(port, timeoutMs = 8_000) {
+  const deadline = Date.now() + timeoutMs;
+  while (Date.now() < deadline) {
     try {
-      const targets = await fetch(`http://127.0.0.1:${port}/json`).then((response) => response.json());
-      const target = targets.find((item) => item.type === 'page') ?? targets[0];
-      if (target?.webSocketDebuggerUrl) return target.webSocketDebuggerUrl;
+      const version = await fetch(`http://127.0.0.1:${port}/json/version`).then((response) => response.json());
+      if (version?.webSocketDebuggerUrl) return version.webSocketDebuggerUrl;
     } catch {
       // Keep polling.
     }
-    await sleep(200);
+    await sleep(50);
   }
-  throw new Error('Timed out waiting for Chrome devtools target');
+  throw new Error('Timed out waiting for Chrome devtools endpoint');
+}
+
+// Each viewport gets its own browser context so localStorage, IndexedDB, and
+// focus stay isolated while the checks run concurrently. Contexts are also
+// disposed if the devtools connection closes early.
+async function openIsolatedPage(browser) {
+  const context = await browser.send('Target.createBrowserContext', { disposeOnDetach: true });
+  if (context.error) throw new Error(`Could not create browser context: ${context.error.message}`);
+  const { browserContextId } = context.result;
+  const target = await browser.send('Target.createTarget', { url: 'about:blank', browserContextId });
+  const attached = await browser.send('Target.attachToTarget', { targetId: target.result.targetId, flatten: true });
+  const { sessionId } = attached.result;
+  const page = {
+    send: (method, params = {}) => browser.send(method, params, sessionId),
+    dispose: () => browser.send('Target.disposeBrowserContext', { browserContextId }),
+  };
+  await page.send('Page.enable');
+  await page.send('Runtime.enable');
+  await page.send('Network.enable');
+  await page.send('Network.setBlockedURLs', { urls: BLOCKED_URLS });
+  await page.send('Emulation.setFocusEmulationEnabled', { enabled: true });
+  return page;
+}
+
+// Runs items on a bounded set of workers. Each worker warms its next isolated
+// page while the current item runs, so no item waits on context creation.
+async function runWithPagePool(browser, items, size, run) {
+  const results = new Array(items.length);
+  let nextIndex = 0;
+  const warm = () => {
+    const page = openIsolatedPage(browser);
+    // Failures surface when the page is awaited, not as unhandled rejections.
+    page.catch(() => {});
+    return page;
+  };
+  const worker = async () => {
+    let warmPage = warm();
+    try {
+      while (nextIndex < items.length) {
+        const index = nextIndex++;
+        const page = await warmPage;
+        warmPage = nextIndex < items.length ? warm() : null;
+        try {
+          results[index] = await run(page, items[index]);
+        } finally {
+          await page.dispose();
+        }
+      }
+    } finally {
+      if (warmPage) await warmPage.then((page) => page.dispose(), () => {});
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(size, items.length) }, worker));
+  return results;
 }
 
 async function evaluate(cdp, expression) {
   const response = await cdp.send('Runtime.evaluate', { expression, returnByValue: true, awaitPromise: true });
+  if (response.error) throw new Error(response.error.message);
   if (response.result.exceptionDetails) {
     throw new Error(response.result.exceptionDetails.text ?? 'Runtime evaluation failed');
   }
   return response.result.result.value;
 }
 
-async function waitForBoard(cdp) {
-  for (let i = 0; i < 120; i++) {
-    const hasBoard = await evaluate(cdp, '!!document.querySelector("[data-board-snapshot=true]")');
-    if (hasBoard) return;
-    await sleep(150);
+// In-page waiter that resolves true once `condition` holds, or false at the
+// timeout. DOM mutations wake it immediately; a backing-off timer (16ms up to
+// 1s) covers state that changes without touching the DOM.
+function observeUntil(condition, timeoutMs) {
+  return `new Promise((resolve) => {
+    const condition = ${condition};
+    const deadline = performance.now() + ${timeoutMs};
+    let delay = 16;
+    let timer = null;
+    let done = false;
+    const finish = (value) => {
+      done = true;
+      observer.disconnect();
+      clearTimeout(timer);
+      resolve(value);
+    };
+    const check = () => {
+      if (done) return;
+      if (condition()) finish(true);
+      else if (performance.now() >= deadline) finish(false);
+    };
+    const poll = () => {
+      check();
+      if (done) return;
+      timer = setTimeout(poll, Math.max(0, Math.min(delay, deadline - performance.now())));
+      delay = Math.min(delay * 2, 1000);
+    };
+    const observer = new MutationObserver(check);
+    observer.observe(document, { childList: true, subtree: true, attributes: true, characterData: true });
+    poll();
+  })`;
+}
+
+async function waitForCondition(cdp, condition, label, timeoutMs = 5_000) {
+  const met = await evaluate(cdp, observeUntil(condition, timeoutMs));
+  if (!met) throw new Error(`Timed out waiting for ${label}`);
+}
+
+// The board element exists before the layout around it settles, so wait until
+// its rect holds still across consecutive frames before measuring it.
+async function waitForBoardLayout(cdp, stableFrames = 2, maxFrames = 60) {
+  await evaluate(cdp, `new Promise((resolve) => {
+    let previous = '';
+    let stable = 0;
+    let frames = 0;
+    const tick = () => {
+      const board = document.querySelector('${BOARD_SELECTOR}');
+      const r = board?.getBoundingClientRect();
+      const current = r ? [r.left, r.top, r.width, r.height].join(',') : '';
+      stable = current && current === previous ? stable + 1 : 0;
+      previous = current;
+      if (stable >= ${stableFrames} || ++frames >= ${maxFrames}) return resolve(true);
+      requestAnimationFrame(tick);
+    };
+    requestAnimationFrame(tick);
+  })`);
+}
+
+// Plain-object snapshot of an element's rect, shared by the in-page scripts
+// that need to return or compare layout boxes.
+const pageRect = `(el) => {
+  if (!el) return null;
+  const r = el.getBoundingClientRect();
+  return { left: r.left, top: r.top, right: r.right, bottom: r.bottom, width: r.width, height: r.height };
+}`;
+
+const findMobileHomeContinue = `() => Array.from(document.querySelectorAll('button')).find((button) => {
+  const label = [
+    button.getAttribute('aria-label') || '',
+    button.getAttribute('title') || '',
+    button.textContent || '',
+  ].join(' ');
+  return label.includes('Continue Board') || label.includes('Open board');
+})`;
+
+async function waitForBoard(cdp, timeoutMs = 18_000) {
+  const deadline = Date.now() + timeoutMs;
+  while (Date.now() < deadline) {
+    try {
+      const hasBoard = await evaluate(cdp, observeUntil(
+        `() => !!document.querySelector('${BOARD_SELECTOR}')`,
+        Math.max(0, deadline - Date.now())
+      ));
+      if (hasBoard) return;
+    } catch {
+      // The navigation replaced the document mid-wait; observe the new one.
+      await sleep(50);
+    }
   }
   const diagnostic = await evaluate(cdp, `(() => ({
     readyState: document.readyState,
@@ -205,32 +383,49 @@ async function waitForBoard(cdp) {
   throw new Error(`Board did not render${diagnostic ? ` (${JSON.stringify(diagnostic)})` : ''}`);
 }
 
+// Captures go straight to Page.captureScreenshot: the viewport is already
+// pinned by setDeviceMetricsOverride, so no per-shot layout metrics or
+// viewport round trips are needed, and encoding favors speed over file size.
+// The shots are for eyeballing layout, so JPEG is plenty and much cheaper to
+// encode than PNG. The disk write is not awaited here, so the next check
+// starts while the bytes land; main() waits on screenshotWrites at the end.
+const screenshotWrites = [];
+
+async function saveScreenshot(cdp, fileName) {
+  const screenshot = await cdp.send('Page.captureScreenshot', {
+    format: 'jpeg',
+    quality: 80,
+    captureBeyondViewport: false,
+    optimizeForSpeed: true,
+  });
+  screenshotWrites.push(fs.promises.writeFile(path.join(screenshotDir, fileName), Buffer.from(screenshot.result.data, 'base64')));
+}
+
+function pushFailureGroup(failures, groupFailures, label) {
+  if (groupFailures.length > 0) failures.push(`${label}: ${groupFailures.join(', ')}`);
+}
+
+function pushSmallTouchTargets(failures, targets, label) {
+  if (targets.length === 0) return;
+  const summary = targets
+    .slice(0, 8)
+    .map((target) => `${target.modal ? `${target.modal}: ` : ''}${target.label} ${Math.round(target.width)}x${Math.round(target.height)}`)
+    .join(', ');
+  failures.push(`${targets.length} ${label} below 44px: ${summary}`);
+}
+
 function assertViewport(result) {
   const failures = [];
   if (result.boardInteractionFailures?.length > 0) {
     failures.push(...result.boardInteractionFailures);
   }
-  if (result.navigationSmokeFailures.length > 0) {
-    failures.push(`navigation smoke failures: ${result.navigationSmokeFailures.join(', ')}`);
-  }
-  if (result.captureSmokeFailures.length > 0) {
-    failures.push(`capture smoke failures: ${result.captureSmokeFailures.join(', ')}`);
-  }
-  if (result.fullscreenSmokeFailures.length > 0) {
-    failures.push(`fullscreen smoke failures: ${result.fullscreenSmokeFailures.join(', ')}`);
-  }
-  if (result.pwaBannerFailures.length > 0) {
-    failures.push(`PWA banner failures: ${result.pwaBannerFailures.join(', ')}`);
-  }
-  if (result.photoBoardTraceImportFailures.length > 0) {
-    failures.push(`photo board trace import failures: ${result.photoBoardTraceImportFailures.join(', ')}`);
-  }
-  if (result.boardThemeSmokeFailures.length > 0) {
-    failures.push(`board theme smoke failures: ${result.boardThemeSmokeFailures.join(', ')}`);
-  }
-  if (result.localeSmokeFailures.length > 0) {
-    failures.push(`locale smoke failures: ${result.localeSmokeFailures.join(', ')}`);
-  }
+  pushFailureGroup(failures, result.navigationSmokeFailures, 'navigation smoke failures');
+  pushFailureGroup(failures, result.captureSmokeFailures, 'capture smoke failures');
+  pushFailureGroup(failures, result.fullscreenSmokeFailures, 'fullscreen smoke failures');
+  pushFailureGroup(failures, result.pwaBannerFailures, 'PWA banner failures');
+  pushFailureGroup(failures, result.photoBoardTraceImportFailures, 'photo board trace import failures');
+  pushFailureGroup(failures, result.boardThemeSmokeFailures, 'board theme smoke failures');
+  pushFailureGroup(failures, result.localeSmokeFailures, 'locale smoke failures');
   if (result.documentOverflow > 1) failures.push(`document overflows by ${result.documentOverflow}px`);
   if (!result.board) failures.push('board missing');
   if (result.board && result.board.left < -1) failures.push('board overflows left edge');
@@ -261,82 +456,28 @@ function assertViewport(result) {
     if (!result.editToolsReachable) failures.push('mobile edit tools not reachable');
     if (!result.noteEditorReachable) failures.push('mobile note editor not reachable from Review tab');
     if (!result.noteEditorKeyboardAware) failures.push('mobile note editor is missing keyboard-aware scroll margin');
-    if (result.noteEditorLifecycleFailures.length > 0) {
-      failures.push(`mobile note editor lifecycle failures: ${result.noteEditorLifecycleFailures.join(', ')}`);
-    }
+    pushFailureGroup(failures, result.noteEditorLifecycleFailures, 'mobile note editor lifecycle failures');
     if (!result.boardTouchAction.includes('pinch-zoom') && result.boardTouchAction !== 'manipulation') {
       failures.push(`play-mode board touch-action does not allow pinch zoom (${result.boardTouchAction})`);
     }
     if (result.editModeBoardTouchAction !== 'none') {
       failures.push(`edit-mode board touch-action should be none (${result.editModeBoardTouchAction})`);
     }
-    if (result.smallTouchTargets.length > 0) {
-      const summary = result.smallTouchTargets
-        .slice(0, 8)
-        .map((target) => `${target.label} ${Math.round(target.width)}x${Math.round(target.height)}`)
-        .join(', ');
-      failures.push(`${result.smallTouchTargets.length} mobile touch target(s) below 44px: ${summary}`);
-    }
-    if (result.editModeSmallTouchTargets.length > 0) {
-      const summary = result.editModeSmallTouchTargets
-        .slice(0, 8)
-        .map((target) => `${target.label} ${Math.round(target.width)}x${Math.round(target.height)}`)
-        .join(', ');
-      failures.push(`${result.editModeSmallTouchTargets.length} edit-mode touch target(s) below 44px: ${summary}`);
-    }
-    if (result.reviewSmallTouchTargets.length > 0) {
-      const summary = result.reviewSmallTouchTargets
-        .slice(0, 8)
-        .map((target) => `${target.label} ${Math.round(target.width)}x${Math.round(target.height)}`)
-        .join(', ');
-      failures.push(`${result.reviewSmallTouchTargets.length} review-tab touch target(s) below 44px: ${summary}`);
-    }
-    if (result.modalSmallTouchTargets.length > 0) {
-      const summary = result.modalSmallTouchTargets
-        .slice(0, 8)
-        .map((target) => `${target.modal}: ${target.label} ${Math.round(target.width)}x${Math.round(target.height)}`)
-        .join(', ');
-      failures.push(`${result.modalSmallTouchTargets.length} modal touch target(s) below 44px: ${summary}`);
-    }
-  }
-  if (result.modalSmokeFailures.length > 0) {
-    failures.push(`modal smoke failures: ${result.modalSmokeFailures.join(', ')}`);
-  }
-  if (result.clipboardSmokeFailures.length > 0) {
-    failures.push(`clipboard smoke failures: ${result.clipboardSmokeFailures.join(', ')}`);
-  }
-  if (result.editToolSmokeFailures.length > 0) {
-    failures.push(`edit tool smoke failures: ${result.editToolSmokeFailures.join(', ')}`);
+    pushSmallTouchTargets(failures, result.smallTouchTargets, 'mobile touch target(s)');
+    pushSmallTouchTargets(failures, result.editModeSmallTouchTargets, 'edit-mode touch target(s)');
+    pushSmallTouchTargets(failures, result.reviewSmallTouchTargets, 'review-tab touch target(s)');
+    pushSmallTouchTargets(failures, result.modalSmallTouchTargets, 'modal touch target(s)');
   }
+  pushFailureGroup(failures, result.modalSmokeFailures, 'modal smoke failures');
+  pushFailureGroup(failures, result.clipboardSmokeFailures, 'clipboard smoke failures');
+  pushFailureGroup(failures, result.editToolSmokeFailures, 'edit tool smoke failures');
   if (!result.scorePanelReachable) failures.push('score panel not reachable');
-  if (result.scorePanelFailures.length > 0) {
-    failures.push(`score panel failures: ${result.scorePanelFailures.join(', ')}`);
-  }
-  if (result.scorePanelSmallTouchTargets.length > 0) {
-    const summary = result.scorePanelSmallTouchTargets
-      .slice(0, 8)
-      .map((target) => `${target.label} ${Math.round(target.width)}x${Math.round(target.height)}`)
-      .join(', ');
-    failures.push(`${result.scorePanelSmallTouchTargets.length} score panel touch target(s) below 44px: ${summary}`);
-  }
+  pushFailureGroup(failures, result.scorePanelFailures, 'score panel failures');
+  pushSmallTouchTargets(failures, result.scorePanelSmallTouchTargets, 'score panel touch target(s)');
   if (!result.analysisDepthReachable) failures.push('analysis depth selector not reachable');
-  if (result.analysisDepthFailures.length > 0) {
-    failures.push(`analysis depth failures: ${result.analysisDepthFailures.join(', ')}`);
-  }
-  if (result.analysisDepthSmallTouchTargets.length > 0) {
-    const summary = result.analysisDepthSmallTouchTargets
-      .slice(0, 8)
-      .map((target) => `${target.label} ${Math.round(target.width)}x${Math.round(target.height)}`)
-      .join(', ');
-    failures.push(`${result.analysisDepthSmallTouchTargets.length} analysis depth touch target(s) below 44px: ${summary}`);
-  }
-  if (result.pwaBannerSmallTouchTargets.length > 0) {
-    const summary = result.pwaBannerSmallTouchTargets
-      .slice(0, 8)
-      .map((target) => `${target.label} ${Math.round(target.width)}x${Math.round(target.height)}`)
-      .join(', ');
-    failures.push(`${result.pwaBannerSmallTouchTargets.length} PWA banner touch target(s) below 44px: ${summary}`);
-  }
+  pushFailureGroup(failures, result.analysisDepthFailures, 'analysis depth failures');
+  pushSmallTouchTargets(failures, result.analysisDepthSmallTouchTargets, 'analysis depth touch target(s)');
+  pushSmallTouchTargets(failures, result.pwaBannerSmallTouchTargets, 'PWA banner touch target(s)');
   if (result.commandBarOverlaps.length > 0) {
     const summary = result.commandBarOverlaps
       .slice(0, 6)
@@ -354,7 +495,7 @@ async function main() {
   fs.mkdirSync(screenshotDir, { recursive: true });
 
   const appPort = await freePort();
-  const devtoolsPort = await freePort();
+  const devtoolsPort = reusedDevtoolsPort ?? await freePort();
   const server = spawn(path.join('node_modules', '.bin', 'vite'), [
     '--host',
     '127.0.0.1',
@@ -364,78 +505,83 @@ async function main() {
   ], { stdio: ['ignore', 'pipe', 'pipe'] });
 
   let chrome;
+  let browser;
   try {
-    await waitForHttp(`http://127.0.0.1:${appPort}/`);
-
-    chrome = spawn(chromePath, [
-      '--headless=new',
-      '--disable-gpu',
-      '--no-first-run',
-      '--no-default-browser-check',
-      `--remote-debugging-port=${devtoolsPort}`,
-      '--window-size=1280,900',
-      'about:blank',
-    ], { stdio: ['ignore', 'ignore', 'ignore'] });
-
-    const target = await chromeTarget(devtoolsPort);
-    const cdp = connectDevtools(target);
-    await cdp.ready;
-    await cdp.send('Page.enable');
-    await cdp.send('Runtime.enable');
-
-    const results = [];
-    for (const viewport of VIEWPORTS) {
-      const appUrl = `http://127.0.0.1:${appPort}/`;
+    if (!reusedDevtoolsPort) {
+      chrome = spawn(chromePath, [
+        '--headless=new',
+        '--disable-gpu',
+        '--no-first-run',
+        '--no-default-browser-check',
+        // Skip browser services the smoke test never uses.
+        '--disable-extensions',
+        '--disable-component-update',
+        '--disable-background-networking',
+        '--disable-default-apps',
+        '--disable-sync',
+        '--disable-dev-shm-usage',
+        '--disable-features=Translate,MediaRouter,OptimizationHints',
+        '--mute-audio',
+        '--disable-background-timer-throttling',
+        '--disable-backgrounding-occluded-windows',
+        '--disable-renderer-backgrounding',
+        `--remote-debugging-port=${devtoolsPort}`,
+        ...(chromeProfileDir ? [`--user-data-dir=${chromeProfileDir}`] : []),
+        '--window-size=1280,900',
+        'about:blank',
+      ], { stdio: ['ignore', 'ignore', 'ignore'] });
+    }
+    // Chrome and Vite start independently; wait for both at once. The HTTP
+    // checks only start once each port accepts connections.
+    const [, webSocketDebuggerUrl] = await Promise.all([
+      waitForPort(appPort).then(() => waitForHttp(`http://127.0.0.1:${appPort}/`)),
+      waitForPort(devtoolsPort).then(() => chromeBrowserEndpoint(devtoolsPort)),
+    ]);
+    browser = connectDevtools(webSocketDebuggerUrl);
+    await browser.ready;
+
+    const appUrl = `http://127.0.0.1:${appPort}/`;
+    const results = await runWithPagePool(browser, VIEWPORTS, viewportConcurrency, async (cdp, viewport) => {
       await cdp.send('Emulation.setDeviceMetricsOverride', {
         width: viewport.width,
         height: viewport.height,
         deviceScaleFactor: 1,
         mobile: viewport.mobile,
       });
-      await cdp.send('Page.navigate', { url: appUrl });
-      await waitForBoard(cdp);
       if (viewport.width === 1024 && viewport.height === 768 && !viewport.mobile) {
-        await evaluate(cdp, `(() => {
-          localStorage.setItem('web-katrain:library_open:v1', 'true');
-          localStorage.setItem('web-katrain:sidebar_open:v1', 'true');
-        })()`);
-        await cdp.send('Page.navigate', { url: appUrl });
-        await waitForBoard(cdp);
-      }
-      await evaluate(cdp, `(() => {
-        const continueButton = Array.from(document.querySelectorAll('button')).find((button) => {
-          const label = [
-            button.getAttribute('aria-label') || '',
-            button.getAttribute('title') || '',
-            button.textContent || '',
-          ].join(' ');
-          return label.includes('Continue Board') || label.includes('Open board');
+        // Seed both panels open before the app boots rather than loading it
+        // twice; the context is fresh, so nothing else is in storage.
+        await cdp.send('Page.addScriptToEvaluateOnNewDocument', {
+          source: `
+            localStorage.setItem('web-katrain:library_open:v1', 'true');
+            localStorage.setItem('web-katrain:sidebar_open:v1', 'true');
+          `,
         });
+      }
+      await cdp.send('Page.navigate', { url: appUrl });
+      await waitForBoard(cdp);
+      const continuedFromHome = await evaluate(cdp, `(() => {
+        const continueButton = (${findMobileHomeContinue})();
         if (!continueButton) return false;
         continueButton.click();
         return true;
       })()`);
-      await sleep(300);
-      const defaultLayout = await evaluate(cdp, `(() => {
-        const board = document.querySelector('[data-board-snapshot="true"]');
+      if (continuedFromHome) {
+        await waitForCondition(cdp, `() => !(${findMobileHomeContinue})()`, 'mobile home to close');
+      }
+      await waitForBoardLayout(cdp);
+      // Neither the measurement nor the capture changes the page, so the two
+      // round trips can overlap.
+      const [defaultLayout] = await Promise.all([evaluate(cdp, `(() => {
+        const board = document.querySelector('${BOARD_SELECTOR}');
         if (!board) return { board: null };
-        const r = board.getBoundingClientRect();
         return {
-          board: { left: r.left, top: r.top, right: r.right, bottom: r.bottom, width: r.width, height: r.height },
+          board: (${pageRect})(board),
           documentOverflow: Math.max(document.documentElement.scrollWidth, document.body.scrollWidth) - innerWidth,
         };
-      })()`);
-      const defaultScreenshot = await cdp.send('Page.captureScreenshot', { format: 'png', captureBeyondViewport: false });
-      fs.writeFileSync(
-        path.join(screenshotDir, `${viewport.width}x${viewport.height}.png`),
-        Buffer.from(defaultScreenshot.result.data, 'base64')
-      );
+      })()`), saveScreenshot(cdp, `${viewport.width}x${viewport.height}.jpg`)]);
       const result = await evaluate(cdp, `(async () => {
-        const rect = (el) => {
-          if (!el) return null;
-          const r = el.getBoundingClientRect();
-          return { left: r.left, top: r.top, right: r.right, bottom: r.bottom, width: r.width, height: r.height };
-        };
+        const rect = ${pageRect};
         const intersects = (a, b) => !!a && !!b && a.left < b.right && a.right > b.left && a.top < b.bottom && a.bottom > b.top;
         const dashboard = document.querySelector('.wk-dashboard');
         const topBar = dashboard?.querySelector('.header') ||
@@ -459,7 +605,7 @@ async function main() {
         const topControlsOutOfBar = topControlsOutOfBarDetails.length;
         const topToggle = Array.from(document.querySelectorAll('button')).find((button) => (button.getAttribute('title') || '').includes('top bar')) || null;
         const editToolbar = document.querySelector('[data-edit-toolbar]');
-        const board = document.querySelector('[data-board-snapshot="true"]');
+        const board = document.querySelector('${BOARD_SELECTOR}');
         // Paste SGF / OGS and Photo Board live in the header File menu ('More file
         // actions'); the dedicated smoke flows open that menu to reach them.
         const requiredFileActions = ['New game', 'Save SGF', 'Load SGF, board photo, or model weights', 'More file actions'];
@@ -493,7 +639,7 @@ async function main() {
           return r.width > 0 && r.height > 0 && r.bottom >= 0 && r.right >= 0 && r.top <= innerHeight && r.left <= innerWidth;
         };
         const auditSmallTouchTargets = (scope = document) => Array.from(scope.querySelectorAll('button, input, select, textarea, a[href], [role="button"], [role="tab"]'))
-          .filter((el) => !el.closest('[data-board-snapshot="true"], [data-photo-board-trace-grid="true"]'))
+          .filter((el) => !el.closest('${BOARD_SELECTOR}, [data-photo-board-trace-grid="true"]'))
           .filter(isVisibleTarget)
           .map((el) => ({ el, r: el.getBoundingClientRect() }))
           .filter(({ r }) => r.width < 44 || r.height < 44)
@@ -507,7 +653,7 @@ async function main() {
         const commandBarRect = rect(commandBar);
         const commandBarOverlaps = commandBarRect
           ? Array.from(document.querySelectorAll('button, input, select, textarea, a[href], [role="button"], [role="tab"]'))
-            .filter((el) => !el.closest('[data-analysis-command-bar="true"], [data-board-snapshot="true"], [data-photo-board-trace-grid="true"]'))
+            .filter((el) => !el.closest('[data-analysis-command-bar="true"], ${BOARD_SELECTOR}, [data-photo-board-trace-grid="true"]'))
             .filter(isVisibleTarget)
             .map((el) => ({ el, r: rect(el) }))
             .filter(({ r }) => intersects(r, commandBarRect))
@@ -533,9 +679,30 @@ async function main() {
           }
           control.dispatchEvent(new Event('input', { bubbles: true }));
         };
+        // Board geometry only changes with layout, so a clicker reads the board
+        // rect on its first click and reuses it for the rest of a smoke flow.
+        const boardClicker = (boardEl, cellSize, originX, originY) => {
+          let boardRect = null;
+          return async (x, y, settleFrames = 4) => {
+            boardRect ??= boardEl.getBoundingClientRect();
+            boardEl.dispatchEvent(new MouseEvent('click', {
+              bubbles: true,
+              cancelable: true,
+              clientX: boardRect.left + originX + x * cellSize,
+              clientY: boardRect.top + originY + y * cellSize,
+            }));
+            await waitForFrames(settleFrames);
+          };
+        };
+        const waitForBoardMoveCount = async (boardEl, moveCount) => {
+          for (let i = 0; i < 60; i++) {
+            if (Number(boardEl.getAttribute('data-board-move-count')) === moveCount) return;
+            await waitForFrames(1);
+          }
+        };
         const runBoardInteractionSmoke = async () => {
           const failures = [];
-          const boardEl = document.querySelector('[data-board-snapshot="true"]');
+          const boardEl = document.querySelector('${BOARD_SELECTOR}');
           if (!boardEl) return ['board interaction smoke: board missing'];
           const size = Number(boardEl.getAttribute('data-board-size'));
           const cellSize = Number(boardEl.getAttribute('data-board-cell-size'));
@@ -554,16 +721,7 @@ async function main() {
 
           const emptyIndex = beforeStones.indexOf('.');
           if (emptyIndex < 0) return ['board interaction smoke: no empty intersection available'];
-          const x = emptyIndex % size;
-          const y = Math.floor(emptyIndex / size);
-          const r = boardEl.getBoundingClientRect();
-          boardEl.dispatchEvent(new MouseEvent('click', {
-            bubbles: true,
-            cancelable: true,
-            clientX: r.left + originX + x * cellSize,
-            clientY: r.top + originY + y * cellSize,
-          }));
-          await waitForFrames(4);
+          await boardClicker(boardEl, cellSize, originX, originY)(emptyIndex % size, Math.floor(emptyIndex / size));
 
           const afterMoveCount = Number(boardEl.getAttribute('data-board-move-count'));
           const afterPlayer = boardEl.getAttribute('data-board-current-player');
@@ -579,7 +737,7 @@ async function main() {
         };
         const runNavigationSmoke = async () => {
           const failures = [];
-          const boardEl = document.querySelector('[data-board-snapshot="true"]');
+          const boardEl = document.querySelector('${BOARD_SELECTOR}');
           if (!boardEl) return ['navigation smoke: board missing'];
           const size = Number(boardEl.getAttribute('data-board-size'));
           const cellSize = Number(boardEl.getAttribute('data-board-cell-size'));
@@ -595,25 +753,18 @@ async function main() {
           }
           if (!Number.isFinite(initialMoveCount)) return ['navigation smoke: move-count metadata invalid'];
 
-          const clickBoardIndex = async (index) => {
-            const x = index % size;
-            const y = Math.floor(index / size);
-            const r = boardEl.getBoundingClientRect();
-            boardEl.dispatchEvent(new MouseEvent('click', {
-              bubbles: true,
-              cancelable: true,
-              clientX: r.left + originX + x * cellSize,
-              clientY: r.top + originY + y * cellSize,
-            }));
-            await waitForFrames(4);
-          };
+          const clickBoardPoint = boardClicker(boardEl, cellSize, originX, originY);
+          const clickBoardIndex = (index, settleFrames) => clickBoardPoint(index % size, Math.floor(index / size), settleFrames);
           const emptyIndexes = [];
           for (let i = 0; i < initialStones.length; i++) {
             if (initialStones[i] === '.') emptyIndexes.push(i);
           }
           if (emptyIndexes.length < 3) return ['navigation smoke: not enough empty points'];
           const moveIndexes = emptyIndexes.slice(0, 3);
-          for (const index of moveIndexes) await clickBoardIndex(index);
+          // The store applies each move synchronously, so dispatch all three
+          // clicks back to back and wait for the board to render once.
+          for (const index of moveIndexes) await clickBoardIndex(index, 0);
+          await waitForBoardMoveCount(boardEl, initialMoveCount + 3);
 
           const atEndMoveCount = Number(boardEl.getAttribute('data-board-move-count'));
           const atEndStones = boardEl.getAttribute('data-board-stones') || '';
@@ -669,7 +820,7 @@ async function main() {
         };
         const runCaptureSmoke = async () => {
           const failures = [];
-          const boardEl = document.querySelector('[data-board-snapshot="true"]');
+          const boardEl = document.querySelector('${BOARD_SELECTOR}');
           if (!boardEl) return ['capture smoke: board missing'];
           const size = Number(boardEl.getAttribute('data-board-size'));
           const cellSize = Number(boardEl.getAttribute('data-board-cell-size'));
@@ -687,16 +838,7 @@ async function main() {
           const expectedCaptor = firstPlayer === 'black' ? 'B' : firstPlayer === 'white' ? 'W' : null;
           if (!expectedCaptor) failures.push('capture smoke: current-player metadata invalid');
 
-          const clickPoint = async (x, y) => {
-            const r = boardEl.getBoundingClientRect();
-            boardEl.dispatchEvent(new MouseEvent('click', {
-              bubbles: true,
-              cancelable: true,
-              clientX: r.left + originX + x * cellSize,
-              clientY: r.top + originY + y * cellSize,
-            }));
-            await waitForFrames(4);
-          };
+          const clickPoint = boardClicker(boardEl, cellSize, originX, originY);
 
           const sequence = [
             [3, 4],  // Captor D15
@@ -723,7 +865,7 @@ async function main() {
         };
         const runEditToolSmoke = async () => {
           const failures = [];
-          const boardEl = document.querySelector('[data-board-snapshot="true"]');
+          const boardEl = document.querySelector('${BOARD_SELECTOR}');
           if (!boardEl) return ['edit tool smoke: board missing'];
           const size = Number(boardEl.getAttribute('data-board-size'));
           const cellSize = Number(boardEl.getAttribute('data-board-cell-size'));
@@ -737,16 +879,8 @@ async function main() {
             return ['edit tool smoke: board geometry metadata invalid'];
           }
 
-          const clickBoardPoint = async (x, y) => {
-            const r = boardEl.getBoundingClientRect();
-            boardEl.dispatchEvent(new MouseEvent('click', {
-              bubbles: true,
-              cancelable: true,
-              clientX: r.left + originX + x * cellSize,
-              clientY: r.top + originY + y * cellSize,
-            }));
-            await waitForFrames(4);
-          };
+          // Measured lazily on the first click, after the edit toolbar has opened.
+          const clickBoardPoint = boardClicker(boardEl, cellSize, originX, originY);
           const xyToSgf = (x, y) => String.fromCharCode(97 + x) + String.fromCharCode(97 + y);
           const emptyIndexes = [];
           for (let i = 0; i < beforeStones.length; i++) {
@@ -978,7 +1112,7 @@ async function main() {
               dispatchShortcut('F12');
               await waitForFrames(8);
             });
-            const boardEl = document.querySelector('[data-board-snapshot="true"]');
+            const boardEl = document.querySelector('${BOARD_SELECTOR}');
             const stones = boardEl?.getAttribute('data-board-stones') || '';
             const size = Number(boardEl?.getAttribute('data-board-size'));
             const ddIndex = 3 + 3 * size;
@@ -1144,6 +1278,16 @@ async function main() {
           const candidateLabel = targetLabel(candidate);
           return candidateLabel === label || candidateLabel.includes(label) || targetSearchText(candidate).includes(label);
         }) || null;
+        // Waits for the button to mount, like a locator would, so callers do not
+        // need a fixed frame wait between opening a menu and using it.
+        const waitForButtonByLabel = async (label, scope = document) => {
+          for (let i = 0; i < 30; i++) {
+            const button = findButtonByLabel(label, scope);
+            if (button) return button;
+            await waitForFrames(1);
+          }
+          return null;
+        };
         const closeDialog = async (dialog, closeLabel) => {
           const button = findButtonByLabel(closeLabel, dialog);
           if (!button) return false;
@@ -1151,6 +1295,30 @@ async function main() {
           await waitForFrames(2);
           return true;
         };
+        // Callers wait for the photo board dialog with waitForSelector, so no
+        // settle frames are needed after the final click.
+        const openPhotoBoard = async () => {
+          if (${viewport.mobile}) {
+            const toolsButton = findButtonByLabel('Tools');
+            if (!toolsButton) throw new Error('Tools button missing');
+            toolsButton.click();
+            const toolsDialog = await waitForSelector('[data-mobile-tools-dialog="true"]');
+            if (!toolsDialog) throw new Error('Tools dialog did not open');
+            const photoBoardButton = findButtonByLabel('Photo Board', toolsDialog);
+            if (!photoBoardButton) throw new Error('Photo Board action missing in tools');
+            photoBoardButton.click();
+            return;
+          }
+          let photoBoardButton = findButtonByLabel('Photo Board');
+          if (!photoBoardButton) {
+            const moreFileActions = findButtonByLabel('More file actions');
+            if (!moreFileActions) throw new Error('Photo Board action missing');
+            moreFileActions.click();
+            photoBoardButton = await waitForButtonByLabel('Photo Board');
+          }
+          if (!photoBoardButton) throw new Error('Photo Board action missing');
+          photoBoardButton.click();
+        };
         const smokeModal = async ({ name, selector, closeLabel, open, afterOpen }) => {
           try {
             await open();
@@ -1213,7 +1381,7 @@ async function main() {
         const runBoardThemePickerSmoke = async (dialog) => {
           if (boardThemeSmokeRan) return;
           boardThemeSmokeRan = true;
-          const boardEl = document.querySelector('[data-board-snapshot="true"]');
+          const boardEl = document.querySelector('${BOARD_SELECTOR}');
           const beforeTheme = boardEl?.getAttribute('data-board-theme') || '';
           const picker = dialog.querySelector('[data-board-theme-picker="true"]');
           if (!boardEl) {
@@ -1237,7 +1405,7 @@ async function main() {
           }
           nextChoice.click();
           await waitForFrames(4);
-          const afterTheme = document.querySelector('[data-board-snapshot="true"]')?.getAttribute('data-board-theme') || '';
+          const afterTheme = document.querySelector('${BOARD_SELECTOR}')?.getAttribute('data-board-theme') || '';
           if (afterTheme !== nextTheme) {
             boardThemeSmokeFailures.push('board theme did not update from ' + beforeTheme + ' to ' + nextTheme + ' (saw ' + afterTheme + ')');
           }
@@ -1290,31 +1458,6 @@ async function main() {
             }
             return false;
           };
-          const openPhotoBoard = async () => {
-            if (${viewport.mobile}) {
-              const toolsButton = findButtonByLabel('Tools');
-              if (!toolsButton) throw new Error('Tools button missing');
-              toolsButton.click();
-              const toolsDialog = await waitForSelector('[data-mobile-tools-dialog="true"]');
-              if (!toolsDialog) throw new Error('Tools dialog did not open');
-              const photoBoardButton = findButtonByLabel('Photo Board', toolsDialog);
-              if (!photoBoardButton) throw new Error('Photo Board action missing in tools');
-              photoBoardButton.click();
-              await waitForFrames(2);
-              return;
-            }
-            let photoBoardButton = findButtonByLabel('Photo Board');
-            if (!photoBoardButton) {
-              const moreFileActions = findButtonByLabel('More file actions');
-              if (!moreFileActions) throw new Error('Photo Board action missing');
-              moreFileActions.click();
-              await waitForFrames(2);
-              photoBoardButton = findButtonByLabel('Photo Board');
-            }
-            if (!photoBoardButton) throw new Error('Photo Board action missing');
-            photoBoardButton.click();
-            await waitForFrames(2);
-          };
           const createSyntheticBoardPhoto = async (boardSize, blackPoint, whitePoint) => {
             const canvas = document.createElement('canvas');
             canvas.width = 760;
@@ -1454,7 +1597,7 @@ async function main() {
             await waitForFrames(4);
             if (!(await waitForDialogClose())) failures.push('import did not close photo board dialog');
 
-            const importedBoard = document.querySelector('[data-board-snapshot="true"]');
+            const importedBoard = document.querySelector('${BOARD_SELECTOR}');
             const importedSize = Number(importedBoard?.getAttribute('data-board-size'));
             const importedMoveCount = Number(importedBoard?.getAttribute('data-board-move-count'));
             const importedStones = importedBoard?.getAttribute('data-board-stones') || '';
@@ -1546,7 +1689,6 @@ async function main() {
           closeLabel: 'Close keyboard shortcuts',
           open: async () => {
             dispatchShortcut('?');
-            await waitForFrames(2);
           },
         });
         await smokeModal({
@@ -1566,7 +1708,6 @@ async function main() {
           closeLabel: 'Close game report',
           open: async () => {
             dispatchShortcut('F3');
-            await waitForFrames(2);
           },
           afterOpen: async (dialog) => {
             const guide = Array.from(dialog.querySelectorAll('button')).find((candidate) => targetLabel(candidate).includes('Open report guide'));
@@ -1629,7 +1770,6 @@ async function main() {
                 await waitForFrames(2);
               });
             }
-            await waitForFrames(2);
           },
           afterOpen: async (dialog) => {
             if (!dialog.querySelector('.settings-tabs')) {
@@ -1658,30 +1798,7 @@ async function main() {
           name: 'photo board',
           selector: '[aria-labelledby="photo-board-title"]',
           closeLabel: 'Close photo board',
-          open: async () => {
-            if (${viewport.mobile}) {
-              const toolsButton = findButtonByLabel('Tools');
-              if (!toolsButton) throw new Error('Tools button missing');
-              toolsButton.click();
-              const toolsDialog = await waitForSelector('[data-mobile-tools-dialog="true"]');
-              if (!toolsDialog) throw new Error('Tools dialog did not open');
-              const photoBoardButton = findButtonByLabel('Photo Board', toolsDialog);
-              if (!photoBoardButton) throw new Error('Photo Board action missing in tools');
-              photoBoardButton.click();
-            } else {
-              let photoBoardButton = findButtonByLabel('Photo Board');
-              if (!photoBoardButton) {
-                const moreFileActions = findButtonByLabel('More file actions');
-                if (!moreFileActions) throw new Error('Photo Board action missing');
-                moreFileActions.click();
-                await waitForFrames(2);
-                photoBoardButton = findButtonByLabel('Photo Board');
-              }
-              if (!photoBoardButton) throw new Error('Photo Board action missing');
-              photoBoardButton.click();
-            }
-            await waitForFrames(2);
-          },
+          open: openPhotoBoard,
           afterOpen: async (dialog) => {
             if (!dialog.querySelector('[data-photo-board-empty-source="true"]')) {
               modalSmokeFailures.push('photo board empty source missing');
@@ -1702,7 +1819,6 @@ async function main() {
           analysisDepthFailures.push('analyze control missing');
         } else {
           analyzeButton.click();
-          await waitForFrames(4);
           const commandBar = await waitForSelector('[data-analysis-command-bar="true"]');
           const depthButton = commandBar?.querySelector('[data-analysis-live-depth="true"]');
           if (!commandBar || !depthButton) {
@@ -1719,7 +1835,6 @@ async function main() {
             }
           } else {
             depthButton.click();
-            await waitForFrames(2);
             const depthPopover = await waitForSelector('[data-analysis-live-depth-popover="true"]');
             if (!depthPopover) {
               analysisDepthReachable = false;
@@ -1758,7 +1873,6 @@ async function main() {
           scorePanelReachable = false;
         } else {
           scoreButton.click();
-          await waitForFrames(2);
           const scorePanel = await waitForSelector('.manual-score-panel');
           if (!scorePanel) {
             scorePanelReachable = false;
@@ -1853,20 +1967,17 @@ async function main() {
       result.defaultBoard = defaultLayout.board;
       result.defaultDocumentOverflow = defaultLayout.documentOverflow;
       assertViewport(result);
-      const screenshot = await cdp.send('Page.captureScreenshot', { format: 'png', captureBeyondViewport: false });
-      fs.writeFileSync(
-        path.join(screenshotDir, `${viewport.width}x${viewport.height}-qa-state.png`),
-        Buffer.from(screenshot.result.data, 'base64')
-      );
-      results.push(result);
-    }
-    cdp.close();
+      await saveScreenshot(cdp, `${viewport.width}x${viewport.height}-qa-state.jpg`);
+      return result;
+    });
+    await Promise.all(screenshotWrites);
     console.log(`Viewport checks passed. Screenshots: ${screenshotDir}`);
     for (const result of results) {
       const board = result.defaultBoard ?? result.board;
       console.log(`${result.viewport}: board ${Math.round(board.width)}x${Math.round(board.height)}`);
     }
   } finally {
+    browser?.close();
     chrome?.kill('SIGTERM');
     server.kill('SIGTERM');
   }
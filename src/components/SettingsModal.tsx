@@ -2,7 +2,7 @@ import React from 'react';
 import { shallow } from 'zustand/shallow';
 import { useGameStore } from '../store/gameStore';
 import { FaBolt, FaCheck, FaGlobe, FaMicrochip, FaTimes } from 'react-icons/fa';
-import type { GameSettings } from '../types';
+import type { BoardThemeId, GameSettings } from '../types';
 import { ENGINE_MAX_TIME_MS, ENGINE_MAX_VISITS } from '../engine/katago/limits';
 import {
     KATAGO_RECOMMENDED_MODEL_NAME,
@@ -127,6 +127,97 @@ interface SettingsModalProps {
     onClose: () => void;
 }
 
+const BOARD_THEME_CHOICES = BOARD_THEME_OPTIONS.map((theme) => ({ ...theme, config: getBoardTheme(theme.value) }));
+
+// The previews are the heaviest part of the General tab; memoized so edits elsewhere in the modal skip them.
+const BoardThemePicker = React.memo(function BoardThemePicker({
+    value,
+    onChange,
+}: {
+    value: BoardThemeId;
+    onChange: (value: BoardThemeId) => void;
+}) {
+    return (
+        <div
+            className="grid grid-cols-2 gap-2 sm:grid-cols-3"
+            role="radiogroup"
+            aria-labelledby="settings-board-theme-label"
+            data-board-theme-picker="true"
+        >
+            {BOARD_THEME_CHOICES.map((theme) => {
+                const selected = value === theme.value;
+                const lineColor = theme.config.board.foregroundColor ?? '#000000';
+                const texture = theme.config.board.texture;
+                const backgroundImage = [
+                    texture ? `url("${texture}")` : null,
+                    `linear-gradient(${lineColor} 1px, transparent 1px)`,
+                    `linear-gradient(90deg, ${lineColor} 1px, transparent 1px)`,
+                ].filter(Boolean).join(', ');
+                const backgroundSize = `${texture ? '100% 100%, ' : ''}20% 20%, 20% 20%`;
+                const stoneStyle = (player: 'black' | 'white'): React.CSSProperties => {
+                    const stone = theme.config.stones[player];
+                    return {
+                        backgroundColor: stone.backgroundColor,
+                        backgroundImage: stone.image ? `url("${stone.image}")` : undefined,
+                        backgroundPosition: 'center',
+                        backgroundRepeat: 'no-repeat',
+                        backgroundSize: 'cover',
+                        border: stone.borderWidth && stone.borderColor ? `${stone.borderWidth} solid ${stone.borderColor}` : undefined,
+                        boxShadow: stone.shadowColor && stone.shadowColor !== 'transparent'
+                            ? `${stone.shadowOffsetX ?? '0'} ${stone.shadowOffsetY ?? '0'} ${stone.shadowBlur ?? '0'} ${stone.shadowColor}`
+                            : undefined,
+                    };
+                };
+
+                return (
+                    <button
+                        key={theme.value}
+                        type="button"
+                        role="radio"
+                        aria-checked={selected}
+                        aria-label={`Board theme ${theme.label}`}
+                        data-board-theme-choice={theme.value}
+                        onClick={() => onChange(theme.value)}
+                        className={[
+                            'group rounded-lg border p-2 text-left transition-colors',
+                            selected
+                                ? 'border-[var(--ui-accent)] bg-[var(--ui-accent-soft)] text-[var(--ui-text)]'
+                                : 'border-[var(--ui-border)] bg-[var(--ui-surface)] text-[var(--ui-text-muted)] hover:bg-[var(--ui-surface-2)] hover:text-[var(--ui-text)]',
+                        ].join(' ')}
+                    >
+                        <span
+                            className="relative mb-2 block h-16 overflow-hidden rounded-md border"
+                            style={{
+                                backgroundColor: theme.config.board.backgroundColor,
+                                backgroundImage,
+                                backgroundSize,
+                                borderColor: theme.config.board.borderColor ?? lineColor,
+                            }}
+                            aria-hidden="true"
+                        >
+                            <span className="absolute left-[21%] top-[26%] h-4 w-4 rounded-full" style={stoneStyle('black')} />
+                            <span className="absolute left-[55%] top-[42%] h-4 w-4 rounded-full" style={stoneStyle('white')} />
+                            <span className="absolute left-[35%] top-[62%] h-4 w-4 rounded-full" style={stoneStyle('black')} />
+                        </span>
+                        <span className="flex min-w-0 items-center justify-between gap-2">
+                            <span className="truncate text-xs font-semibold">{theme.label}</span>
+                            {selected ? <span className="text-[10px] font-mono text-[var(--ui-accent)]">On</span> : null}
+                        </span>
+                        {theme.config.description ? (
+                            <span
+                                className="mt-1 block truncate text-[10px] leading-tight ui-text-faint"
+                                title={theme.config.description}
+                            >
+                                {theme.config.description}
+                            </span>
+                        ) : null}
+                    </button>
+                );
+            })}
+        </div>
+    );
+});
+
 const ANALYSIS_OVERLAY_SHORTCUT_IDS = [
     'toggle-children',
     'toggle-eval',
@@ -276,9 +367,17 @@ export const SettingsModal: React.FC<SettingsModalProps> = ({ onClose }) => {
         focusBackendOption(nextOption.value);
     };
     const maxHandicap = getMaxHandicap(settings.defaultBoardSize);
-    const boardThemeChoices = React.useMemo(
-        () => BOARD_THEME_OPTIONS.map((theme) => ({ ...theme, config: getBoardTheme(theme.value) })),
-        []
+    const handleBoardThemeChange = React.useCallback(
+        (boardTheme: BoardThemeId) => updateSettings({ boardTheme }),
+        [updateSettings]
+    );
+    const handleLastNMistakesChange = React.useCallback(
+        (e: React.ChangeEvent<HTMLInputElement>) => updateSettings({ showLastNMistakes: parseInt(e.target.value, 10) }),
+        [updateSettings]
+    );
+    const handleMistakeThresholdChange = React.useCallback(
+        (e: React.ChangeEvent<HTMLInputElement>) => updateSettings({ mistakeThreshold: parseFloat(e.target.value) }),
+        [updateSettings]
     );
 
     React.useEffect(() => {
@@ -504,83 +603,7 @@ export const SettingsModal: React.FC<SettingsModalProps> = ({ onClose }) => {
                                                 <div id="settings-board-theme-label" className="ui-text-muted">Board Theme</div>
                                                 <span className="text-xs ui-text-faint">Kaya-style previews</span>
                                             </div>
-                                            <div
-                                                className="grid grid-cols-2 gap-2 sm:grid-cols-3"
-                                                role="radiogroup"
-                                                aria-labelledby="settings-board-theme-label"
-                                                data-board-theme-picker="true"
-                                            >
-                                                {boardThemeChoices.map((theme) => {
-                                                    const selected = settings.boardTheme === theme.value;
-                                                    const lineColor = theme.config.board.foregroundColor ?? '#000000';
-                                                    const texture = theme.config.board.texture;
-                                                    const backgroundImage = [
-                                                        texture ? `url("${texture}")` : null,
-                                                        `linear-gradient(${lineColor} 1px, transparent 1px)`,
-                                                        `linear-gradient(90deg, ${lineColor} 1px, transparent 1px)`,
-                                                    ].filter(Boolean).join(', ');
-                                                    const backgroundSize = `${texture ? '100% 100%, ' : ''}20% 20%, 20% 20%`;
-                                                    const stoneStyle = (player: 'black' | 'white'): React.CSSProperties => {
-                                                        const stone = theme.config.stones[player];
-                                                        return {
-                                                            backgroundColor: stone.backgroundColor,
-                                                            backgroundImage: stone.image ? `url("${stone.image}")` : undefined,
-                                                            backgroundPosition: 'center',
-                                                            backgroundRepeat: 'no-repeat',
-                                                            backgroundSize: 'cover',
-                                                            border: stone.borderWidth && stone.borderColor ? `${stone.borderWidth} solid ${stone.borderColor}` : undefined,
-                                                            boxShadow: stone.shadowColor && stone.shadowColor !== 'transparent'
-                                                                ? `${stone.shadowOffsetX ?? '0'} ${stone.shadowOffsetY ?? '0'} ${stone.shadowBlur ?? '0'} ${stone.shadowColor}`
-                                                                : undefined,
-                                                        };
-                                                    };
-
-                                                    return (
-                                                        <button
-                                                            key={theme.value}
-                                                            type="button"
-                                                            role="radio"
-                                                            aria-checked={selected}
-                                                            aria-label={`Board theme ${theme.label}`}
-                                                            data-board-theme-choice={theme.value}
-                                                            onClick={() => updateSettings({ boardTheme: theme.value })}
-                                                            className={[
-                                                                'group rounded-lg border p-2 text-left transition-colors',
-                                                                selected
-                                                                    ? 'border-[var(--ui-accent)] bg-[var(--ui-accent-soft)] text-[var(--ui-text)]'
-                                                                    : 'border-[var(--ui-border)] bg-[var(--ui-surface)] text-[var(--ui-text-muted)] hover:bg-[var(--ui-surface-2)] hover:text-[var(--ui-text)]',
-                                                            ].join(' ')}
-                                                        >
-                                                            <span
-                                                                className="relative mb-2 block h-16 overflow-hidden rounded-md border"
-                                                                style={{
-                                                                    backgroundColor: theme.config.board.backgroundColor,
-                                                                    backgroundImage,
-                                                                    backgroundSize,
-                                                                    borderColor: theme.config.board.borderColor ?? lineColor,
-                                                                }}
-                                                                aria-hidden="true"
-                                                            >
-                                                                <span className="absolute left-[21%] top-[26%] h-4 w-4 rounded-full" style={stoneStyle('black')} />
-                                                                <span className="absolute left-[55%] top-[42%] h-4 w-4 rounded-full" style={stoneStyle('white')} />
-                                                                <span className="absolute left-[35%] top-[62%] h-4 w-4 rounded-full" style={stoneStyle('black')} />
-                                                            </span>
-                                                            <span className="flex min-w-0 items-center justify-between gap-2">
-                                                                <span className="truncate text-xs font-semibold">{theme.label}</span>
-                                                                {selected ? <span className="text-[10px] font-mono text-[var(--ui-accent)]">On</span> : null}
-                                                            </span>
-                                                            {theme.config.description ? (
-                                                                <span
-                                                                    className="mt-1 block truncate text-[10px] leading-tight ui-text-faint"
-                                                                    title={theme.config.description}
-                                                                >
-                                                                    {theme.config.description}
-                                                                </span>
-                                                            ) : null}
-                                                        </button>
-                                                    );
-                                                })}
-                                            </div>
+                                            <BoardThemePicker value={settings.boardTheme} onChange={handleBoardThemeChange} />
                                         </div>
 
                                         <div className="grid grid-cols-1 sm:grid-cols-2 gap-3">
@@ -1099,7 +1122,7 @@ export const SettingsModal: React.FC<SettingsModalProps> = ({ onClose }) => {
                                                     min="0"
                                                     max="10"
                                                     value={settings.showLastNMistakes}
-                                                    onChange={(e) => updateSettings({ showLastNMistakes: parseInt(e.target.value, 10) })}
+                                                    onChange={handleLastNMistakesChange}
                                                     className="flex-1"
                                                 />
                                                 <span className="text-[var(--ui-text)] font-mono w-8 text-right">{settings.showLastNMistakes}</span>
@@ -1119,7 +1142,7 @@ export const SettingsModal: React.FC<SettingsModalProps> = ({ onClose }) => {
                                                     max="10"
                                                     step="0.5"
                                                     value={settings.mistakeThreshold ?? 3.0}
-                                                    onChange={(e) => updateSettings({ mistakeThreshold: parseFloat(e.target.value) })}
+                                                    onChange={handleMistakeThresholdChange}
                                                     className="flex-1"
                                                 />
                                                 <span className="text-[var(--ui-text)] font-mono w-10 text-right">{(settings.mistakeThreshold ?? 3.0).toFixed(1)}</span>